@@ -5,10 +5,15 @@ Fetches and applies OpenAEC Foundation naming conventions.
 """
 
 import base64
+import functools
+import http.client
+import pickle
 import re
+import string
 import subprocess
+import urllib.request
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 
 try:
     import yaml
@@ -16,43 +21,109 @@ except ImportError:
     print("Error: pyyaml not installed. Run: pip install pyyaml")
     raise
 
+# Prefer the libyaml-backed loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# ASCII character classes used by extract_words
+_DIGIT, _LOWER, _UPPER, _SEPARATOR, _OTHER = range(5)
+_CHAR_CLASSES = bytes(
+    _DIGIT if '0' <= chr(c) <= '9' else
+    _LOWER if 'a' <= chr(c) <= 'z' else
+    _UPPER if 'A' <= chr(c) <= 'Z' else
+    _SEPARATOR if chr(c) in '-_' else
+    _OTHER
+    for c in range(128)
+)
+
+
+# Names with more segments than this need manual review
+MAX_SEGMENTS = 3
+
+# Deletes the characters that can never start a new word
+_NON_BOUNDARY_CHARS = str.maketrans('', '', string.ascii_lowercase + string.digits)
+
+# Names must contain at least one of these to be valid
+_LETTER_RE = re.compile(r'[a-zA-Z]')
+
 
 # Case conversion functions
-def extract_words(name: str) -> List[str]:
+@functools.lru_cache(maxsize=4096)
+def extract_words(name: str) -> Tuple[str, ...]:
     """Extract words from any casing style and return them lowercase."""
-    # Verify name contains at least one letter
-    if not re.search(r'[a-zA-Z]', name):
-        raise ValueError(f"Name must contain at least one letter: '{name}'")
-
     # Strip leading/trailing hyphens and underscores
-    name = name.strip('-_')
+    stripped = name.strip('-_')
+    length = len(stripped)
+
+    # snake_case and kebab-case split on separators only,
+    # PascalCase/camelCase split on capitals
+    split_on_case = '_' not in stripped and '-' not in stripped
+
+    words = []
+    start = -1 if split_on_case else 0
+    has_letter = False
+    prev = _OTHER
+
+    for i, char in enumerate(stripped):
+        code = ord(char)
+        cls = _CHAR_CLASSES[code] if code < 128 else _OTHER
+        if cls == _LOWER or cls == _UPPER:
+            has_letter = True
+
+        if not split_on_case:
+            if cls == _SEPARATOR:
+                words.append(stripped[start:i].lower())
+                start = i + 1
+        elif cls == _DIGIT or cls == _LOWER:
+            if start < 0:
+                start = i
+        elif cls == _UPPER:
+            if start < 0:
+                start = i
+            else:
+                following = ord(stripped[i + 1]) if i + 1 < length else 128
+                if prev != _UPPER or (following < 128 and _CHAR_CLASSES[following] == _LOWER):
+                    # Lower->upper transition, or last capital of an acronym (PDFStudio)
+                    words.append(stripped[start:i].lower())
+                    start = i
+        elif start >= 0:
+            words.append(stripped[start:i].lower())
+            start = -1
+        prev = cls
 
-    # Handle snake_case and kebab-case
-    if '_' in name or '-' in name:
-        return [w.lower() for w in re.split(r'[-_]', name)]
+    # Verify name contains at least one letter
+    if not has_letter:
+        raise ValueError(f"Name must contain at least one letter: '{name}'")
 
-    # Handle PascalCase/camelCase - split on capitals
-    words = re.findall(r'[A-Z]?[a-z0-9]+|[A-Z]+(?=[A-Z][a-z]|\b)', name)
-    return [w.lower() for w in words] if words else [name.lower()]
+    if start >= 0:
+        words.append(stripped[start:].lower())
+    return tuple(words)
 
 
-def convert_case(name_or_words, target_case: str) -> str:
+def _is_fast_valid(pattern: re.Pattern, name: str) -> bool:
     """
-    Convert to target case. Merges first letters if >3 segments.
+    True if name matches pattern, contains a letter and cannot exceed MAX_SEGMENTS.
 
-    Args:
-        name_or_words: String name or list of pre-extracted words
-        target_case: 'kebab-case', 'snake_case', 'camelCase', or 'PascalCase'
+    Every word after the first starts at an uppercase letter, a separator or
+    another non-[a-z0-9] character, so counting those bounds the segment count
+    without splitting the name into words.
     """
-    # Extract words if string provided
-    if isinstance(name_or_words, str):
-        words = extract_words(name_or_words)
-    else:
-        words = name_or_words
+    return (
+        pattern.match(name) is not None
+        and len(name.translate(_NON_BOUNDARY_CHARS)) < MAX_SEGMENTS
+        and _LETTER_RE.search(name) is not None
+    )
+
 
-    # Merge if > 3 segments
-    if len(words) > 3:
-        words = [''.join(w[0] for w in words)]
+@functools.lru_cache(maxsize=4096)
+def _convert_from_words(words: Tuple[str, ...], target_case: str) -> str:
+    """Join pre-extracted words in target case. Merges first letters if >3 segments."""
+    # Merge if > MAX_SEGMENTS segments
+    if len(words) > MAX_SEGMENTS:
+        words = (''.join(w[0] for w in words),)
 
     # Apply target case
     if target_case == 'kebab-case':
@@ -65,16 +136,33 @@ def convert_case(name_or_words, target_case: str) -> str:
         return ''.join(w.capitalize() for w in words)
 
 
+def convert_case(name_or_words, target_case: str) -> str:
+    """
+    Convert to target case. Merges first letters if >3 segments.
+
+    Args:
+        name_or_words: String name or sequence of pre-extracted words
+        target_case: 'kebab-case', 'snake_case', 'camelCase', or 'PascalCase'
+    """
+    # Extract words if string provided
+    if isinstance(name_or_words, str):
+        words = extract_words(name_or_words)
+    else:
+        words = tuple(name_or_words)
+
+    return _convert_from_words(words, target_case)
+
+
 # Supported case styles
 CASE_STYLES = ['kebab-case', 'snake_case', 'camelCase', 'PascalCase']
 
 
 # Case pattern registry
-CASE_PATTERNS: dict[str, str] = {
-    'kebab-case': r'^[a-z0-9]+(-[a-z0-9]+)*$',
-    'snake_case': r'^[a-z][a-z0-9_]*$',
-    'camelCase': r'^[a-z][a-zA-Z0-9]*$',
-    'PascalCase': r'^[A-Z][a-zA-Z0-9]*$',
+CASE_PATTERNS: dict[str, re.Pattern] = {
+    'kebab-case': re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$'),
+    'snake_case': re.compile(r'^[a-z][a-z0-9_]*$'),
+    'camelCase': re.compile(r'^[a-z][a-zA-Z0-9]*$'),
+    'PascalCase': re.compile(r'^[A-Z][a-zA-Z0-9]*$'),
 }
 
 
@@ -82,6 +170,7 @@ class Convention:
     """Stores and applies naming conventions."""
 
     CACHE_PATH = Path.home() / '.cache' / 'openaec-conventions.yaml'
+    CACHE_PICKLE_PATH = CACHE_PATH.with_suffix('.pkl')
     REPO = 'OpenAEC-Foundation/conventions'
     FILE_PATH = 'conventions.yaml'
 
@@ -98,9 +187,22 @@ class Convention:
         self.data = conventions_dict
         self.naming = conventions_dict.get('naming', {})
         self.cases = self.naming.get('case', {})
+        self._patterns: dict[str, re.Pattern] = {}
+        self._pattern_errors: dict[str, str] = {}
+        self._build_patterns()
 
     def _fetch_from_github(self) -> str:
         """Fetch conventions.yaml content from GitHub."""
+        url = f'https://raw.githubusercontent.com/{self.REPO}/HEAD/{self.FILE_PATH}'
+        try:
+            with urllib.request.urlopen(url, timeout=10) as response:
+                return response.read().decode('utf-8')
+        except (OSError, http.client.HTTPException, UnicodeDecodeError):
+            # Not publicly reachable (e.g. private repo) or a broken download, go through the API
+            return self._fetch_via_gh()
+
+    def _fetch_via_gh(self) -> str:
+        """Fetch conventions.yaml content through the authenticated gh CLI."""
         try:
             result = subprocess.run(
                 ['gh', 'api', f'repos/{self.REPO}/contents/{self.FILE_PATH}',
@@ -122,13 +224,36 @@ class Convention:
                 f"Error: {e}"
             ) from e
 
+    def _load_pickle(self) -> Optional[dict]:
+        """Load parsed conventions from the pickle cache if it is up to date."""
+        try:
+            if self.CACHE_PICKLE_PATH.stat().st_mtime < self.CACHE_PATH.stat().st_mtime:
+                return None
+            return pickle.loads(self.CACHE_PICKLE_PATH.read_bytes())
+        except Exception:
+            # Missing, stale or unreadable pickle, parse the YAML instead
+            return None
+
+    def _save_pickle(self, data: dict):
+        """Store parsed conventions next to the YAML cache."""
+        try:
+            self.CACHE_PICKLE_PATH.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass
+
     def _load(self) -> dict:
         """Load conventions from cache or GitHub."""
         # Try cache first
         if self.CACHE_PATH.exists():
+            data = self._load_pickle()
+            if data is not None:
+                return data
+
             try:
                 content = self.CACHE_PATH.read_text()
-                return yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YamlLoader)
+                self._save_pickle(data)
+                return data
             except yaml.YAMLError as e:
                 raise RuntimeError(
                     f"Cached conventions file is corrupted: {self.CACHE_PATH}\n"
@@ -147,7 +272,7 @@ class Convention:
         self.CACHE_PATH.write_text(content)
 
         try:
-            return yaml.safe_load(content)
+            data = yaml.load(content, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise RuntimeError(
                 f"Conventions file from {self.REPO} is not valid YAML\n"
@@ -155,26 +280,58 @@ class Convention:
                 f"This is a bug in the conventions repository"
             ) from e
 
+        self._save_pickle(data)
+        return data
+
     def refresh(self):
         """Refresh conventions from GitHub."""
         content = self._fetch_from_github()
+        self.CACHE_PICKLE_PATH.unlink(missing_ok=True)
         self.CACHE_PATH.write_text(content)
-        self.data = yaml.safe_load(content)
+        self.data = yaml.load(content, Loader=_YamlLoader)
         self.naming = self.data.get('naming', {})
         self.cases = self.naming.get('case', {})
+        self._build_patterns()
+
+    def _build_patterns(self):
+        """
+        Compile case patterns, preferring the conventions file over built-in ones.
 
-    def get_pattern(self, case_name: str) -> Optional[str]:
-        """Get regex pattern for a case style."""
-        # Try conventions file first, fall back to built-in patterns
-        pattern = self.cases.get(case_name, {}).get('pattern')
-        if pattern:
-            return pattern
-        return CASE_PATTERNS.get(case_name)
+        Malformed entries are skipped and invalid regexes are recorded, so only
+        checking against the affected case style fails.
+        """
+        self._patterns = dict(CASE_PATTERNS)
+        self._pattern_errors = {}
+        cases = self.cases if isinstance(self.cases, dict) else {}
+        for case_name, case_data in cases.items():
+            if not isinstance(case_data, dict):
+                continue
+            pattern = case_data.get('pattern')
+            if not pattern:
+                continue
+            try:
+                self._patterns[case_name] = re.compile(pattern)
+            except (re.error, TypeError) as e:
+                self._patterns.pop(case_name, None)
+                self._pattern_errors[case_name] = f"{pattern!r}: {e}"
+
+    def get_pattern(self, case_name: str) -> Optional[re.Pattern]:
+        """Get compiled regex pattern for a case style."""
+        pattern = self._patterns.get(case_name)
+        if pattern is None and case_name in self._pattern_errors:
+            raise RuntimeError(
+                f"Invalid pattern for case style '{case_name}' in conventions file\n"
+                f"Error: {self._pattern_errors[case_name]}"
+            )
+        return pattern
 
     def check(self, name: str, case_name: str) -> List[str]:
         """
         Check if name matches case style.
 
+        Names without any letter are reported as an issue needing manual
+        review rather than raising.
+
         Args:
             name: Name to check
             case_name: Case style (e.g., 'kebab-case')
@@ -182,21 +339,34 @@ class Convention:
         Returns:
             List of issues (empty if valid)
         """
-        issues = []
         pattern = self.get_pattern(case_name)
 
-        if not pattern:
+        if pattern is None:
             return [f"Unknown case style: {case_name}"]
 
-        words = extract_words(name)
+        # Fast path: valid names need no word split
+        if _is_fast_valid(pattern, name):
+            return []
 
-        if len(words) > 3:
-            issues.append("Too many segments (>3) - needs manual review")
-        elif not re.match(pattern, name):
-            issues.append(f"Does not match {case_name}")
-            suggested = convert_case(words, case_name)
-            if suggested != name:
-                issues.append(f"Suggested: '{suggested}'")
+        return self._check_slow(pattern, name, case_name)
+
+    def _check_slow(self, pattern: re.Pattern, name: str, case_name: str) -> List[str]:
+        """Full check for a name that did not pass the fast path."""
+        try:
+            words = extract_words(name)
+        except ValueError as e:
+            return [f"{e} - needs manual review"]
+
+        if len(words) > MAX_SEGMENTS:
+            return [f"Too many segments (>{MAX_SEGMENTS}) - needs manual review"]
+
+        if pattern.match(name):
+            return []
+
+        issues = [f"Does not match {case_name}"]
+        suggested = convert_case(words, case_name)
+        if suggested != name:
+            issues.append(f"Suggested: '{suggested}'")
 
         return issues
 
@@ -207,6 +377,31 @@ class Convention:
             return ["No repository convention defined"]
         return self.check(name, case_style)
 
+    def check_repositories(self, names: List[str]) -> List[List[str]]:
+        """
+        Check many repository names at once.
+
+        Names are first screened with the same fast path as check() in a single
+        pass; the full check only runs for names that don't pass it.
+
+        Returns:
+            List of issue lists, in the same order as names
+        """
+        case_style = self.naming.get('repository', {}).get('case')
+        if not case_style:
+            return [["No repository convention defined"] for _ in names]
+
+        pattern = self.get_pattern(case_style)
+        if pattern is None:
+            return [self.check(name, case_style) for name in names]
+
+        valid_mask = [_is_fast_valid(pattern, name) for name in names]
+
+        return [
+            [] if is_valid else self._check_slow(pattern, name, case_style)
+            for name, is_valid in zip(names, valid_mask)
+        ]
+
     def check_directory(self, name: str) -> List[str]:
         """Check directory name."""
         case_style = self.naming.get('directory', {}).get('case')
@@ -18,20 +18,45 @@ Options:
     --fix-licenses          Apply/update LGPL 3.0 licenses to repositories
     --repo-naming           Check repository naming conventions
     --fix-repo-naming       Rename repositories to fix naming issues
-    --org ORG               GitHub organization name (default: OpenAEC-Foundation)
+    --org ORG               GitHub organization or user name (default: OpenAEC-Foundation)
 """
 
 import argparse
 import base64
+import functools
+import hashlib
+import io
 import json
 import re
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, TextIO, Tuple
 
 from case_checker import get_convention
 
+# Prefer orjson for parsing gh output, fall back to the standard library
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Number of repositories processed concurrently (checks are I/O-bound on gh calls;
+# writes are still serialized, see _mutation_lock)
+MAX_WORKERS = 16
+
+# GitHub asks for content-creating requests to be sent serially,
+# so gh calls that modify repositories or issues hold this lock
+_mutation_lock = threading.Lock()
+
+# Per-run statistics counters
+STAT_KEYS = ('success', 'skipped', 'failed', 'naming_issues', 'missing_readme', 'empty_repos')
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -42,18 +67,32 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
-def print_colored(message: str, color: str = Colors.NC) -> None:
-    """Print colored message to terminal."""
-    print(f"{color}{message}{Colors.NC}")
+def print_colored(message: str, color: str = Colors.NC, file: Optional[TextIO] = None) -> None:
+    """Print colored message to terminal (or to file, if given)."""
+    print(f"{color}{message}{Colors.NC}", file=file)
 
 
-def run_gh_command(args: list[str], capture_output: bool = True) -> Tuple[bool, str]:
+def serialized(func):
+    """Decorate a repository-modifying function so calls never run concurrently."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _mutation_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def run_gh_command(
+    args: list[str],
+    capture_output: bool = True,
+    input: Optional[str] = None
+) -> Tuple[bool, str]:
     """
     Run a gh CLI command and return success status and output.
 
     Args:
         args: Command arguments (without 'gh' prefix)
         capture_output: Whether to capture and return output
+        input: Text to pass to the command on stdin
 
     Returns:
         Tuple of (success: bool, output: str)
@@ -61,6 +100,7 @@ def run_gh_command(args: list[str], capture_output: bool = True) -> Tuple[bool,
     try:
         result = subprocess.run(
             ['gh'] + args,
+            input=input,
             capture_output=capture_output,
             text=True,
             check=True
@@ -68,22 +108,26 @@ def run_gh_command(args: list[str], capture_output: bool = True) -> Tuple[bool,
         return True, result.stdout if capture_output else ""
     except subprocess.CalledProcessError as e:
         return False, e.stderr if capture_output else ""
+    except OSError as e:
+        # gh could not be started (e.g. command line too long)
+        return False, str(e)
 
 
-def check_naming_convention(repo_name: str, convention) -> list[str]:
+def check_naming_conventions(repo_names: list[str], convention) -> list[list[str]]:
     """
-    Check if repository name follows naming conventions.
+    Check a batch of repository names against the naming conventions.
 
     Args:
-        repo_name: Repository name to check
+        repo_names: Repository names to check
         convention: Convention instance
 
     Returns:
-        List of issues found (empty if all good)
+        List of issue lists, in the same order as repo_names
     """
-    return convention.check_repository(repo_name)
+    return convention.check_repositories(repo_names)
 
 
+@serialized
 def rename_repository(org: str, old_name: str, new_name: str) -> bool:
     """
     Rename a repository via the GitHub API.
@@ -96,44 +140,111 @@ def rename_repository(org: str, old_name: str, new_name: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    payload = json.dumps({'name': new_name})
-    try:
-        result = subprocess.run(
-            ['gh', 'api', f'repos/{org}/{old_name}',
-             '--method', 'PATCH', '--input', '-', '--silent'],
-            input=payload,
-            text=True,
-            capture_output=True,
-            check=True
-        )
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    success, _ = run_gh_command([
+        'api', f'repos/{org}/{old_name}',
+        '--method', 'PATCH',
+        '-f', f'name={new_name}',
+        '--silent'
+    ])
+    return success
+
+
+# Cache of file contents fetched via the API, keyed by (org, repo, path)
+_file_content_cache: dict[Tuple[str, str, str], Optional[Tuple[str, str]]] = {}
 
 
 def get_file_content_from_api(org: str, repo: str, path: str) -> Optional[Tuple[str, str]]:
     """
     Get file content and SHA from GitHub API.
 
+    Successful lookups and clean 404s are cached per (org, repo, path) for the
+    lifetime of the process; other failures (rate limits, network errors) are not.
+
     Returns:
         Tuple of (content: str, sha: str) or None if file doesn't exist
     """
+    key = (org, repo, path)
+    if key in _file_content_cache:
+        return _file_content_cache[key]
+
     success, output = run_gh_command([
         'api',
         f'repos/{org}/{repo}/contents/{path}'
     ])
 
     if not success:
+        # A 404 means the file doesn't exist; anything else may be transient
+        if 'HTTP 404' in output:
+            _file_content_cache[key] = None
         return None
 
     try:
-        data = json.loads(output)
+        data = _json_loads(output)
         content = base64.b64decode(data['content']).decode('utf-8')
-        return content, data['sha']
     except (json.JSONDecodeError, KeyError, UnicodeDecodeError):
         return None
 
+    _file_content_cache[key] = content, data['sha']
+    return _file_content_cache[key]
+
+
+# Repository listing with default branch and README.md presence, one page per request.
+# repositoryOwner works for both organizations and user accounts.
+ORG_SNAPSHOT_QUERY = """
+query($org: String!, $endCursor: String) {
+  repositoryOwner(login: $org) {
+    repositories(first: 100, after: $endCursor, ownerAffiliations: [OWNER]) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        defaultBranchRef { name }
+        readmeFile: object(expression: "HEAD:README.md") { oid }
+        %(license_field)s
+      }
+    }
+  }
+}
+"""
+
+# LICENSE.md blob SHA, only requested when licenses are checked
+LICENSE_FILE_FIELD = 'licenseFile: object(expression: "HEAD:LICENSE.md") { ... on Blob { oid } }'
+
+
+def git_blob_sha(content: str) -> str:
+    """Return the git blob SHA-1 of content, as reported by GitHub for files."""
+    data = content.encode('utf-8')
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def fetch_org_snapshot(org: str, include_license: bool = False) -> Optional[list[dict]]:
+    """
+    Fetch all repositories of an organization or user in a single paginated GraphQL query.
+
+    Each entry has the same 'name' and 'defaultBranchRef' keys as `gh repo list`,
+    plus 'readmeFile' ({'oid'} or None) and, if include_license is set,
+    'licenseFile' ({'oid'} or None).
+
+    Returns:
+        List of repository dicts, or None if the query failed
+    """
+    query = ORG_SNAPSHOT_QUERY % {'license_field': LICENSE_FILE_FIELD if include_license else ''}
+    success, output = run_gh_command([
+        'api', 'graphql', '--paginate',
+        '-f', f'query={query}',
+        '-f', f'org={org}',
+        '--jq', '.data.repositoryOwner.repositories.nodes[]'
+    ])
+
+    if not success:
+        return None
+
+    try:
+        return [_json_loads(line) for line in output.splitlines() if line.strip()]
+    except json.JSONDecodeError:
+        return None
 
+
+@serialized
 def update_file_via_api(
     org: str,
     repo: str,
@@ -160,39 +271,27 @@ def update_file_via_api(
     """
     content_b64 = base64.b64encode(content.encode('utf-8')).decode('ascii')
 
-    payload = {
-        'message': message,
-        'content': content_b64,
-        'branch': branch
-    }
-
-    if existing_sha:
-        payload['sha'] = existing_sha
-
-    payload_json = json.dumps(payload)
-
-    success, _ = run_gh_command([
-        'api',
-        f'repos/{org}/{repo}/contents/{path}',
+    args = [
+        'api', f'repos/{org}/{repo}/contents/{path}',
         '--method', 'PUT',
-        '--input', '-',
+        '-f', f'message={message}',
+        '-F', 'content=@-',
+        '-f', f'branch={branch}',
         '--silent'
-    ], capture_output=False)
+    ]
 
-    # We need to pass the payload via stdin
-    try:
-        result = subprocess.run(
-            ['gh', 'api', f'repos/{org}/{repo}/contents/{path}',
-             '--method', 'PUT', '--input', '-', '--silent'],
-            input=payload_json,
-            text=True,
-            capture_output=True,
-            check=True
-        )
-        return True
-    except subprocess.CalledProcessError:
+    if existing_sha:
+        args += ['-f', f'sha={existing_sha}']
+
+    # The encoded content can exceed command-line length limits, so pass it on stdin
+    success, _ = run_gh_command(args, input=content_b64)
+    if not success:
         return False
 
+    # Drop the stale cached content for this file
+    _file_content_cache.pop((org, repo, path), None)
+    return True
+
 
 def create_repo_issue(org: str, repo_name: str, issues: list[str]):
     """Create or update a pinned issue for naming convention violations."""
@@ -202,7 +301,7 @@ def create_repo_issue(org: str, repo_name: str, issues: list[str]):
 
     needs_manual = any("manual review" in issue for issue in issues)
     if needs_manual:
-        body += "\n## Action Required\n\nThis repository has more than 3 segments and requires manual review. Please rename it to follow kebab-case convention with maximum 3 segments.\n"
+        body += "\n## Action Required\n\nThis repository name cannot be fixed automatically and requires manual review. Please rename it to follow kebab-case convention with at least one letter and maximum 3 segments.\n"
     else:
         body += "\n## Action\n\nThis can be automatically fixed. The suggested name is shown above.\n"
 
@@ -210,7 +309,12 @@ def create_repo_issue(org: str, repo_name: str, issues: list[str]):
     create_pinned_issue(org, repo_name, "Naming convention violations", body)
 
 
-def close_repo_issue(org: str, repo_name: str, issue_title: str = "Naming convention violations"):
+def close_repo_issue(
+    org: str,
+    repo_name: str,
+    issue_title: str = "Naming convention violations",
+    file: Optional[TextIO] = None
+):
     """Close and unpin a pinned issue by title if it exists."""
     try:
         result = subprocess.run(
@@ -221,25 +325,27 @@ def close_repo_issue(org: str, repo_name: str, issue_title: str = "Naming conven
             text=True,
             check=True
         )
-        existing_issues = json.loads(result.stdout)
+        existing_issues = _json_loads(result.stdout)
 
         if existing_issues:
             issue_number = str(existing_issues[0]['number'])
 
-            subprocess.run(
-                ['gh', 'issue', 'unpin', issue_number, '-R', f'{org}/{repo_name}'],
-                capture_output=True,
-                check=False
-            )
-
-            subprocess.run(
-                ['gh', 'issue', 'close', issue_number, '-R', f'{org}/{repo_name}',
-                 '--reason', 'completed',
-                 '--comment', 'Resolved.'],
-                capture_output=True,
-                check=True
-            )
-            print_colored(f"  Closed issue #{issue_number} as resolved", Colors.GREEN)
+            # Only the modifying calls are serialized, the lookup above runs concurrently
+            with _mutation_lock:
+                subprocess.run(
+                    ['gh', 'issue', 'unpin', issue_number, '-R', f'{org}/{repo_name}'],
+                    capture_output=True,
+                    check=False
+                )
+
+                subprocess.run(
+                    ['gh', 'issue', 'close', issue_number, '-R', f'{org}/{repo_name}',
+                     '--reason', 'completed',
+                     '--comment', 'Resolved.'],
+                    capture_output=True,
+                    check=True
+                )
+            print_colored(f"  Closed issue #{issue_number} as resolved", Colors.GREEN, file=file)
     except (subprocess.CalledProcessError, Exception):
         pass
 
@@ -255,48 +361,212 @@ def create_pinned_issue(org: str, repo_name: str, title: str, body: str):
             text=True,
             check=True
         )
-        existing_issues = json.loads(result.stdout)
+        existing_issues = _json_loads(result.stdout)
 
-        if existing_issues:
-            issue_number = str(existing_issues[0]['number'])
-            issue_state = existing_issues[0]['state']
+        # Only the modifying calls are serialized, the lookup above runs concurrently
+        with _mutation_lock:
+            if existing_issues:
+                issue_number = str(existing_issues[0]['number'])
+                issue_state = existing_issues[0]['state']
+
+                subprocess.run(
+                    ['gh', 'issue', 'edit', issue_number, '-R', f'{org}/{repo_name}',
+                     '--body', body],
+                    capture_output=True,
+                    check=True
+                )
 
-            subprocess.run(
-                ['gh', 'issue', 'edit', issue_number, '-R', f'{org}/{repo_name}',
-                 '--body', body],
-                check=True
-            )
+                if issue_state == 'CLOSED':
+                    subprocess.run(
+                        ['gh', 'issue', 'reopen', issue_number, '-R', f'{org}/{repo_name}'],
+                        capture_output=True,
+                        check=True
+                    )
 
-            if issue_state == 'CLOSED':
                 subprocess.run(
-                    ['gh', 'issue', 'reopen', issue_number, '-R', f'{org}/{repo_name}'],
+                    ['gh', 'issue', 'pin', issue_number, '-R', f'{org}/{repo_name}'],
+                    capture_output=True,
+                    check=False
+                )
+            else:
+                result = subprocess.run(
+                    ['gh', 'issue', 'create', '-R', f'{org}/{repo_name}',
+                     '--title', title,
+                     '--body', body],
+                    capture_output=True,
+                    text=True,
                     check=True
                 )
+                issue_number = result.stdout.strip().split('/')[-1]
 
-            subprocess.run(
-                ['gh', 'issue', 'pin', issue_number, '-R', f'{org}/{repo_name}'],
-                capture_output=True,
-                check=False
-            )
-        else:
-            result = subprocess.run(
-                ['gh', 'issue', 'create', '-R', f'{org}/{repo_name}',
-                 '--title', title,
-                 '--body', body],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            issue_number = result.stdout.strip().split('/')[-1]
-
-            subprocess.run(
-                ['gh', 'issue', 'pin', issue_number, '-R', f'{org}/{repo_name}'],
-                check=True
-            )
+                subprocess.run(
+                    ['gh', 'issue', 'pin', issue_number, '-R', f'{org}/{repo_name}'],
+                    capture_output=True,
+                    check=True
+                )
     except (subprocess.CalledProcessError, Exception):
         pass
 
 
+def process_repo(
+    repo_data: dict,
+    naming_issues: Optional[list[str]],
+    org: str,
+    convention,
+    check_licenses: bool,
+    apply_licenses: bool,
+    fix_naming: bool,
+    check_readme: bool,
+    license_content: Optional[str],
+    license_sha: Optional[str]
+) -> dict:
+    """
+    Run all requested checks and fixes on a single repository.
+
+    naming_issues holds the precomputed naming check result for this
+    repository, or None if naming is not being checked. license_sha is the
+    git blob SHA of license_content, used to compare against LICENSE.md.
+
+    Output is written to a buffer instead of stdout so repositories can be
+    processed concurrently and still be reported in order.
+
+    Returns:
+        Dict with 'output' (str), 'stats' (counters to add to the totals)
+        and 'naming_issues' (list of issues, empty if none)
+    """
+    out = io.StringIO()
+    result = {
+        'output': '',
+        'stats': dict.fromkeys(STAT_KEYS, 0),
+        'naming_issues': [],
+    }
+
+    repo_name = repo_data['name']
+    default_branch_data = repo_data.get('defaultBranchRef')
+    default_branch = default_branch_data['name'] if default_branch_data else None
+
+    # Check if empty repository
+    is_empty = not default_branch
+    if is_empty:
+        print_colored("⚠ Empty repository", Colors.YELLOW, file=out)
+        result['stats']['empty_repos'] += 1
+        create_pinned_issue(org, repo_name, "Empty repository",
+            "# Empty Repository\n\nThis repository has no commits yet. "
+            "Please add initial content or consider removing it.\n\n"
+            "---\n*This issue was automatically generated by the convention enforcer.*\n")
+
+    # Check naming conventions (applies even to empty repos)
+    if naming_issues is not None:
+        if naming_issues:
+            print_colored("⚠ NAMING ISSUES:", Colors.YELLOW, file=out)
+            for issue in naming_issues:
+                print_colored(f"  - {issue}", Colors.YELLOW, file=out)
+            result['stats']['naming_issues'] += 1
+            result['naming_issues'] = naming_issues
+
+            # Fix naming if requested
+            if fix_naming:
+                needs_manual = any("manual review" in issue for issue in naming_issues)
+                if needs_manual:
+                    print_colored("[SKIP] Too many segments — needs manual review, skipping rename", Colors.YELLOW, file=out)
+                    create_repo_issue(org, repo_name, naming_issues)
+                else:
+                    case_style = convention.naming.get('repository', {}).get('case', 'kebab-case')
+                    suggested_name = convention.get_suggested_name(repo_name, case_style)
+                    print_colored(f"[FIX] Renaming to: {suggested_name}", Colors.BLUE, file=out)
+                    success = rename_repository(org, repo_name, suggested_name)
+                    if success:
+                        print_colored(f"✓ Renamed {repo_name} -> {suggested_name}", Colors.GREEN, file=out)
+                        result['stats']['success'] += 1
+                        close_repo_issue(org, suggested_name, file=out)
+                    else:
+                        print_colored(f"✗ Failed to rename {repo_name}", Colors.RED, file=out)
+                        result['stats']['failed'] += 1
+                        create_repo_issue(org, repo_name, naming_issues)
+            else:
+                # Check-only mode: create/update issue
+                create_repo_issue(org, repo_name, naming_issues)
+        else:
+            # No issues: close any existing violation issue
+            print_colored("✓ Naming OK", Colors.GREEN, file=out)
+            close_repo_issue(org, repo_name, file=out)
+
+    # Skip content checks for empty repos
+    if is_empty:
+        result['output'] = out.getvalue()
+        return result
+
+    # Check README
+    if check_readme:
+        if 'readmeFile' in repo_data:
+            readme_data = repo_data['readmeFile']
+        else:
+            readme_data = get_file_content_from_api(org, repo_name, 'README.md')
+        if readme_data:
+            print_colored("✓ README.md exists", Colors.GREEN, file=out)
+        else:
+            print_colored("⚠ README.md missing", Colors.YELLOW, file=out)
+            result['stats']['missing_readme'] += 1
+
+    # Check licenses
+    if check_licenses:
+        print(f"Default branch: {default_branch}", file=out)
+
+        # Check if LICENSE.md already exists (from the org snapshot when available)
+        if 'licenseFile' in repo_data:
+            license_blob = repo_data['licenseFile']
+            existing_sha = license_blob.get('oid') if license_blob else None
+        else:
+            existing_data = get_file_content_from_api(org, repo_name, 'LICENSE.md')
+            existing_sha = existing_data[1] if existing_data else None
+
+        # Identical content has the identical blob SHA
+        is_up_to_date = existing_sha is not None and existing_sha == license_sha
+
+        if existing_sha:
+            print_colored("LICENSE.md exists, checking content...", Colors.YELLOW, file=out)
+
+            if is_up_to_date:
+                print_colored("✓ LICENSE.md is up to date", Colors.GREEN, file=out)
+                result['stats']['skipped'] += 1
+            else:
+                print_colored("LICENSE.md differs from standard", Colors.YELLOW, file=out)
+        else:
+            print_colored("LICENSE.md not found", Colors.YELLOW, file=out)
+
+        # Apply license if requested
+        if apply_licenses and not is_up_to_date:
+            existing_sha_for_update = existing_sha
+
+            # Prepare commit message
+            commit_message = """Add LGPL 3.0 license
+
+This commit adds the GNU Lesser General Public License v3.0 to the repository.
+
+Co-Authored-By: Claude Sonnet 4.5 <noreply@anthropic.com>"""
+
+            # COMMENTED OUT FOR SAFETY - Remove comments to enable
+            # Update or create the file
+            # if update_file_via_api(
+            #     org, repo_name, 'LICENSE.md',
+            #     license_content, commit_message,
+            #     default_branch, existing_sha_for_update
+            # ):
+            #     print_colored(f"✓ Successfully added license to {repo_name}", Colors.GREEN, file=out)
+            #     result['stats']['success'] += 1
+            # else:
+            #     print_colored(f"✗ Failed to add license to {repo_name}", Colors.RED, file=out)
+            #     result['stats']['failed'] += 1
+
+            # Placeholder for commented out code above
+            action = "update" if existing_sha_for_update else "create"
+            print_colored(f"✓ Would {action} LICENSE.md", Colors.GREEN, file=out)
+            result['stats']['success'] += 1
+
+    result['output'] = out.getvalue()
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='⚠️  POWERFUL TOOL: Apply LGPL 3.0 license and validate repository naming',
@@ -340,7 +610,7 @@ Examples:
     parser.add_argument(
         '--org',
         default='OpenAEC-Foundation',
-        help='GitHub organization name (default: OpenAEC-Foundation)'
+        help='GitHub organization or user name (default: OpenAEC-Foundation)'
     )
     parser.add_argument(
         '--string-naming',
@@ -435,18 +705,20 @@ Examples:
     print()
 
     # Check if gh CLI is installed
-    if subprocess.run(['which', 'gh'], capture_output=True).returncode != 0:
+    if shutil.which('gh') is None:
         print_colored("Error: gh CLI is not installed. Please install it first.", Colors.RED)
         print("Visit: https://cli.github.com/")
         sys.exit(1)
 
     # Check if license file exists (only if we're checking licenses)
     license_content = None
+    license_sha = None
     if check_licenses:
         if not license_file.exists():
             print_colored(f"Error: LICENSE.md not found at {license_file}", Colors.RED)
             sys.exit(1)
         license_content = license_file.read_text()
+        license_sha = git_blob_sha(license_content)
 
     # Get repos to check
     if args.single_repo:
@@ -459,23 +731,13 @@ Examples:
         print_colored(f"Fetching repositories from {org}...", Colors.GREEN)
         print()
 
-        success, output = run_gh_command([
-            'repo', 'list', org,
-            '--limit', '1000',
-            '--json', 'name,defaultBranchRef'
-        ])
+        repos = fetch_org_snapshot(org, include_license=check_licenses)
 
-        if not success:
+        if repos is None:
             print_colored("No repositories found or authentication failed.", Colors.RED)
             print("Please run: gh auth login")
             sys.exit(1)
 
-        try:
-            repos = json.loads(output)
-        except json.JSONDecodeError:
-            print_colored("Failed to parse repository list.", Colors.RED)
-            sys.exit(1)
-
         if not repos:
             print_colored("No repositories found.", Colors.RED)
             sys.exit(1)
@@ -485,143 +747,43 @@ Examples:
     print()
 
     # Statistics
-    stats = {
-        'success': 0,
-        'skipped': 0,
-        'failed': 0,
-        'naming_issues': 0,
-        'missing_readme': 0,
-        'empty_repos': 0,
-    }
+    stats = dict.fromkeys(STAT_KEYS, 0)
 
     # Track all repos with naming issues
     repos_with_issues = []
 
-    # Process each repository
-    for idx, repo_data in enumerate(repos, 1):
-        repo_name = repo_data['name']
-        default_branch_data = repo_data.get('defaultBranchRef')
-        default_branch = default_branch_data['name'] if default_branch_data else None
-
-        print("=" * 48)
-        print_colored(f"[{idx}/{repo_count}] Processing: {repo_name}", Colors.YELLOW)
-        print("=" * 48)
-
-        # Check if empty repository
-        is_empty = not default_branch
-        if is_empty:
-            print_colored("⚠ Empty repository", Colors.YELLOW)
-            stats['empty_repos'] += 1
-            create_pinned_issue(org, repo_name, "Empty repository",
-                "# Empty Repository\n\nThis repository has no commits yet. "
-                "Please add initial content or consider removing it.\n\n"
-                "---\n*This issue was automatically generated by the convention enforcer.*\n")
-
-        # Check naming conventions (applies even to empty repos)
-        if check_naming:
-            naming_issues = check_naming_convention(repo_name, convention)
-            if naming_issues:
-                print_colored("⚠ NAMING ISSUES:", Colors.YELLOW)
-                for issue in naming_issues:
-                    print_colored(f"  - {issue}", Colors.YELLOW)
-                stats['naming_issues'] += 1
-
-                # Track all repos with naming issues
-                repos_with_issues.append({
-                    'name': repo_name,
-                    'issues': naming_issues
-                })
-
-                # Fix naming if requested
-                if fix_naming:
-                    needs_manual = any("manual review" in issue for issue in naming_issues)
-                    if needs_manual:
-                        print_colored("[SKIP] Too many segments — needs manual review, skipping rename", Colors.YELLOW)
-                        create_repo_issue(org, repo_name, naming_issues)
-                    else:
-                        case_style = convention.naming.get('repository', {}).get('case', 'kebab-case')
-                        suggested_name = convention.get_suggested_name(repo_name, case_style)
-                        print_colored(f"[FIX] Renaming to: {suggested_name}", Colors.BLUE)
-                        success = rename_repository(org, repo_name, suggested_name)
-                        if success:
-                            print_colored(f"✓ Renamed {repo_name} -> {suggested_name}", Colors.GREEN)
-                            stats['success'] += 1
-                            close_repo_issue(org, suggested_name)
-                        else:
-                            print_colored(f"✗ Failed to rename {repo_name}", Colors.RED)
-                            stats['failed'] += 1
-                            create_repo_issue(org, repo_name, naming_issues)
-                else:
-                    # Check-only mode: create/update issue
-                    create_repo_issue(org, repo_name, naming_issues)
-            else:
-                # No issues: close any existing violation issue
-                print_colored("✓ Naming OK", Colors.GREEN)
-                close_repo_issue(org, repo_name)
-
-        # Skip content checks for empty repos
-        if is_empty:
-            print()
-            continue
-
-        # Check README
-        if args.readme:
-            readme_data = get_file_content_from_api(org, repo_name, 'README.md')
-            if readme_data:
-                print_colored("✓ README.md exists", Colors.GREEN)
-            else:
-                print_colored("⚠ README.md missing", Colors.YELLOW)
-                stats['missing_readme'] += 1
-
-        # Check licenses
-        if check_licenses:
-            print(f"Default branch: {default_branch}")
-
-            # Check if LICENSE.md already exists
-            existing_data = get_file_content_from_api(org, repo_name, 'LICENSE.md')
-
-            if existing_data:
-                existing_content, existing_sha = existing_data
-                print_colored("LICENSE.md exists, checking content...", Colors.YELLOW)
-
-                if existing_content == license_content:
-                    print_colored("✓ LICENSE.md is up to date", Colors.GREEN)
-                    stats['skipped'] += 1
-                else:
-                    print_colored("LICENSE.md differs from standard", Colors.YELLOW)
-            else:
-                print_colored("LICENSE.md not found", Colors.YELLOW)
-
-            # Apply license if requested
-            if apply_licenses and (not existing_data or existing_content != license_content):
-                existing_sha_for_update = existing_sha if existing_data else None
-
-                # Prepare commit message
-                commit_message = """Add LGPL 3.0 license
+    # Check all repository names in one pass (valid names skip the slow path)
+    if check_naming:
+        all_naming_issues = check_naming_conventions([r['name'] for r in repos], convention)
+    else:
+        all_naming_issues = [None] * repo_count
+
+    # Process repositories concurrently, reporting them in original order
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda repo_data, naming_issues: process_repo(
+                repo_data, naming_issues, org, convention,
+                check_licenses, apply_licenses, fix_naming,
+                args.readme, license_content, license_sha
+            ),
+            repos,
+            all_naming_issues
+        )
 
-This commit adds the GNU Lesser General Public License v3.0 to the repository.
+        for idx, (repo_data, result) in enumerate(zip(repos, results), 1):
+            print("=" * 48)
+            print_colored(f"[{idx}/{repo_count}] Processing: {repo_data['name']}", Colors.YELLOW)
+            print("=" * 48)
+            print(result['output'])
 
-Co-Authored-By: Claude Sonnet 4.5 <noreply@anthropic.com>"""
+            for key, value in result['stats'].items():
+                stats[key] += value
 
-                # COMMENTED OUT FOR SAFETY - Remove comments to enable
-                # Update or create the file
-                # if update_file_via_api(
-                #     org, repo_name, 'LICENSE.md',
-                #     license_content, commit_message,
-                #     default_branch, existing_sha_for_update
-                # ):
-                #     print_colored(f"✓ Successfully added license to {repo_name}", Colors.GREEN)
-                #     stats['success'] += 1
-                # else:
-                #     print_colored(f"✗ Failed to add license to {repo_name}", Colors.RED)
-                #     stats['failed'] += 1
-
-                # Placeholder for commented out code above
-                action = "update" if existing_sha_for_update else "create"
-                print_colored(f"✓ Would {action} LICENSE.md", Colors.GREEN)
-                stats['success'] += 1
-
-        print()
+            if result['naming_issues']:
+                repos_with_issues.append({
+                    'name': repo_data['name'],
+                    'issues': result['naming_issues']
+                })
 
     # Print summary
     print("=" * 48)